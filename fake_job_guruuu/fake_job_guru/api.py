@@ -1,14 +1,23 @@
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal, Tuple
+from functools import lru_cache
+import csv
+import json
 import logging
+import logging.handlers
+import queue
 import time
 import platform
 import os
+import hashlib
+
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field, ValidationError
-from pydantic import field_validator
+from pydantic import conint
 from pydantic import ConfigDict
 
 import warnings
@@ -19,16 +28,70 @@ try:
 except Exception:
     pass
 
-from .scam_detector import predict_job
-
-
-app = FastAPI(title="Fake Job Scam Detector API", version="1.0.0")
+from .scam_detector import predict_job, predict_jobs, prediction_cache_info
 
 
 # ===============================
 # Logging
 # ===============================
+class _BackgroundLogHandler(logging.handlers.QueueHandler):
+    """Hand records to a background thread that writes them to `target`.
+
+    Request threads only enqueue; formatting and the write happen on the listener
+    thread. The listener is started lazily by the first record in each process, so
+    it does not depend on the app lifespan and is recreated after fork (with a fresh
+    queue, dropping records inherited from the parent). The queue is bounded; when
+    it is full the record is written synchronously instead.
+    """
+
+    def __init__(self, target: logging.Handler, maxsize: int = 10000):
+        super().__init__(queue.Queue(maxsize))
+        self.target = target
+        self._maxsize = maxsize
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self._pid: Optional[int] = None
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Leave formatting to the listener thread
+        return record
+
+    def _ensure_listener(self) -> None:
+        # Called under self.lock (Handler.handle serializes emit)
+        if self._pid == os.getpid():
+            return
+        if self._pid is not None:
+            # Forked child: the parent's listener thread does not exist here
+            self.queue = queue.Queue(self._maxsize)
+        self._listener = logging.handlers.QueueListener(self.queue, self.target, respect_handler_level=True)
+        self._listener.start()
+        self._pid = os.getpid()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._ensure_listener()
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.target.handle(record)
+        except Exception:
+            self.handleError(record)
+
+    def stop(self) -> None:
+        """Drain pending records and stop the listener; the next record restarts it."""
+        with self.lock:
+            if self._listener is not None and self._pid == os.getpid():
+                self._listener.stop()
+            self._listener = None
+            self._pid = None
+
+    def close(self) -> None:
+        # Runs from logging.shutdown() at exit, flushing anything still queued
+        self.stop()
+        super().close()
+
+
 logger = logging.getLogger("scam_api")
+# Only set when this module installed the handler (not on a repeated import)
+_log_handler: Optional[_BackgroundLogHandler] = None
 if not logger.handlers:
     handler = logging.StreamHandler()
     formatter = logging.Formatter(
@@ -36,30 +99,89 @@ if not logger.handlers:
         datefmt="%Y-%m-%dT%H:%M:%S%z",
     )
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    _log_handler = _BackgroundLogHandler(handler)
+    logger.addHandler(_log_handler)
 logger.setLevel(logging.INFO)
 
 
+# Static process info for /health, resolved once rather than per request
+_PLATFORM = platform.platform()
+_PYVER = platform.python_version()
+_PID = os.getpid()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _PID
+    # With `gunicorn --preload` this module is imported in the parent; record the worker's pid
+    _PID = os.getpid()
+    # Resolve the dataset shape for /health up front, outside the event loop
+    await run_in_threadpool(_dataset_shape)
+    try:
+        yield
+    finally:
+        # Flush queued log records on shutdown
+        if _log_handler is not None:
+            _log_handler.stop()
+
+
+app = FastAPI(
+    title="Fake Job Scam Detector API",
+    version="1.0.0",
+    # orjson encodes the nested result dicts faster than the stdlib encoder
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+
 # ===============================
-# Load enriched dataset (optional, for context/validation)
+# Enriched dataset metadata (optional, for /health)
 # ===============================
-ENRICHED_DF = None
 _ROOT_DIR = Path(__file__).resolve().parent.parent
-# Prefer new data/ location first
-ENRICHED_PATH = _ROOT_DIR / "data" / "enriched_dataset.csv"
-if not ENRICHED_PATH.exists():
-    # Legacy at project root
-    ENRICHED_PATH = _ROOT_DIR / "enriched_dataset.csv"
-if not ENRICHED_PATH.exists():
-    # Fallback next to API file
-    ENRICHED_PATH = Path(__file__).resolve().parent / "enriched_dataset.csv"
-try:
-    if ENRICHED_PATH.exists():
-        import importlib
-        _pd = importlib.import_module("pandas")
-        ENRICHED_DF = _pd.read_csv(ENRICHED_PATH)
-except Exception:
-    ENRICHED_DF = None
+# Prefer new data/ location first, then legacy project root, then next to API file.
+# Within each location the Parquet output of data_enrichment.py wins over a CSV.
+ENRICHED_PATH = _ROOT_DIR / "data" / "enriched_dataset.parquet"
+for _dir in (_ROOT_DIR / "data", _ROOT_DIR, Path(__file__).resolve().parent):
+    _candidates = [_dir / "enriched_dataset.parquet", _dir / "enriched_dataset.csv"]
+    _found = next((p for p in _candidates if p.exists()), None)
+    if _found is not None:
+        ENRICHED_PATH = _found
+        break
+# Written by data_enrichment.py alongside the dataset
+ENRICHED_META_PATH = ENRICHED_PATH.with_suffix(".meta.json")
+
+
+@lru_cache(maxsize=1)
+def _dataset_shape() -> Optional[Tuple[int, int]]:
+    """Return (rows, cols) of the enriched dataset without keeping it in memory.
+
+    Reads the small metadata file when present and not older than the dataset,
+    then the Parquet footer; a CSV is streamed once. May read the whole CSV, so
+    call it off the event loop (the lifespan warms it via run_in_threadpool).
+    """
+    try:
+        meta_fresh = ENRICHED_META_PATH.exists() and (
+            not ENRICHED_PATH.exists()
+            or ENRICHED_META_PATH.stat().st_mtime >= ENRICHED_PATH.stat().st_mtime
+        )
+        if meta_fresh:
+            meta = json.loads(ENRICHED_META_PATH.read_text(encoding="utf-8"))
+            return int(meta["rows"]), int(meta["cols"])
+        if ENRICHED_PATH.suffix == ".parquet" and ENRICHED_PATH.exists():
+            import importlib
+            _pq = importlib.import_module("pyarrow.parquet")
+            metadata = _pq.read_metadata(ENRICHED_PATH)
+            return int(metadata.num_rows), int(metadata.num_columns)
+        if ENRICHED_PATH.suffix == ".csv" and ENRICHED_PATH.exists():
+            with open(ENRICHED_PATH, "r", encoding="utf-8", newline="") as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                # csv.reader, not line counting: text fields contain embedded newlines
+                rows = sum(1 for _ in reader)
+            return rows, len(header)
+    except Exception:
+        pass
+    return None
 
 
 class AnalyzeJobRequest(BaseModel):
@@ -74,35 +196,13 @@ class AnalyzeJobRequest(BaseModel):
     company_employees: Optional[int] = Field(default=None, alias="employees")
     engagement_score: Optional[int] = Field(default=None, alias="engagement")
 
-    # Derived/enriched categorical/flags (optional)
-    company_strength: Optional[str] = None
-    missing_website_flag: Optional[int] = None
-    suspicious_email_flag: Optional[int] = None
-    short_profile_flag: Optional[int] = None
+    # Derived/enriched categorical/flags (optional); validated by pydantic-core, no Python callbacks
+    company_strength: Optional[Literal["weak", "medium", "strong"]] = None
+    missing_website_flag: Optional[conint(ge=0, le=1)] = None
+    suspicious_email_flag: Optional[conint(ge=0, le=1)] = None
+    short_profile_flag: Optional[conint(ge=0, le=1)] = None
     suspicion_score: Optional[int] = None
 
-    @field_validator("company_strength")
-    def validate_company_strength(cls, v):
-        if v is None:
-            return v
-        allowed = {"weak", "medium", "strong"}
-        lv = str(v).lower()
-        if lv not in allowed:
-            raise ValueError(f"company_strength must be one of {sorted(allowed)}")
-        return lv
-
-    @field_validator("missing_website_flag", "suspicious_email_flag", "short_profile_flag", mode="before")
-    def validate_binary_flags(cls, v):
-        if v is None:
-            return v
-        try:
-            iv = int(v)
-        except Exception:
-            raise ValueError("flag fields must be integers 0 or 1")
-        if iv not in (0, 1):
-            raise ValueError("flag fields must be 0 or 1")
-        return iv
-
     model_config = ConfigDict(populate_by_name=True)
 
 
@@ -113,16 +213,58 @@ class AnalyzeJobResponse(BaseModel):
     signals: Dict[str, Any]
 
 
-@app.get("/", response_class=HTMLResponse)
-def serve_ui():
-    """Serve the main UI page."""
-    template_path = Path(__file__).resolve().parent / "templates" / "index.html"
-    try:
-        with open(template_path, "r", encoding="utf-8") as f:
-            return HTMLResponse(content=f.read())
-    except FileNotFoundError:
-        # Fallback: return a simple HTML string if template file is not found
-        return HTMLResponse(content="""
+# Upper bound on postings per batch request; larger bodies are rejected with 422
+MAX_BATCH_ITEMS = 500
+
+
+class AnalyzeJobsRequest(BaseModel):
+    items: List[AnalyzeJobRequest] = Field(..., max_length=MAX_BATCH_ITEMS)
+
+
+class AnalyzeJobsResponse(BaseModel):
+    items: List[AnalyzeJobResponse]
+
+
+# Handlers return plain dicts (serialized once by ORJSONResponse); the models
+# above document the schema. Only these keys of a prediction are exposed.
+_RESPONSE_FIELDS = tuple(AnalyzeJobResponse.model_fields)
+
+
+def _public_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    return {name: result[name] for name in _RESPONSE_FIELDS}
+
+
+def _job_kwargs(payload: AnalyzeJobRequest) -> Dict[str, Any]:
+    """Map a request payload onto `predict_job` keyword arguments.
+
+    Handlers pass these to `predict_job`/`predict_jobs` via `run_in_threadpool`:
+    the model call is CPU-bound and would otherwise block the event loop.
+    """
+    return {
+        "title": payload.title,
+        "description": payload.description,
+        "requirements": payload.requirements,
+        "company_profile": payload.company_profile,
+        "followers": payload.company_followers,
+        "employees": payload.company_employees,
+        "engagement": payload.engagement_score,
+        "company_strength": payload.company_strength,
+        "missing_website_flag": payload.missing_website_flag,
+        "suspicious_email_flag": payload.suspicious_email_flag,
+        "short_profile_flag": payload.short_profile_flag,
+        "suspicion_score": payload.suspicion_score,
+    }
+
+
+# ===============================
+# UI template (read once at import)
+# ===============================
+_TEMPLATE_PATH = Path(__file__).resolve().parent / "templates" / "index.html"
+try:
+    _INDEX_HTML = _TEMPLATE_PATH.read_text(encoding="utf-8")
+except FileNotFoundError:
+    # Fallback: serve a simple HTML string if template file is not found
+    _INDEX_HTML = """
         <!DOCTYPE html>
         <html>
         <head><title>Fake Job Guru</title></head>
@@ -131,72 +273,91 @@ def serve_ui():
             <p>Template file not found. Please ensure templates/index.html exists.</p>
         </body>
         </html>
-        """)
+        """
+_INDEX_ETAG = '"%s"' % hashlib.md5(_INDEX_HTML.encode("utf-8")).hexdigest()
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header (list, `*`, or W/ tags) against `etag`."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
+
+
+@app.get("/", response_class=HTMLResponse)
+async def serve_ui(request: Request):
+    """Serve the main UI page."""
+    if _etag_matches(request.headers.get("if-none-match"), _INDEX_ETAG):
+        return Response(status_code=304, headers={"ETag": _INDEX_ETAG})
+    return HTMLResponse(content=_INDEX_HTML, headers={"ETag": _INDEX_ETAG})
 
 
 @app.get("/favicon.ico")
-def favicon() -> Response:
+async def favicon() -> Response:
     # Avoid 404 noise for browsers requesting favicon
     return Response(status_code=204)
 
 
 @app.get("/health")
-def health() -> Dict[str, Any]:
+async def health() -> Dict[str, Any]:
     info: Dict[str, Any] = {
         "status": "ok",
-        "python": platform.python_version(),
-        "platform": platform.platform(),
-        "pid": os.getpid(),
+        "python": _PYVER,
+        "platform": _PLATFORM,
+        "pid": _PID,
         "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "app_version": app.version,
     }
-    if ENRICHED_DF is not None:
-        try:
-            info.update({
-                "dataset_rows": int(ENRICHED_DF.shape[0]),
-                "dataset_cols": int(ENRICHED_DF.shape[1]),
-            })
-        except Exception:
-            pass
+    if _dataset_shape.cache_info().currsize:
+        shape = _dataset_shape()
+    else:
+        # Lifespan did not run (e.g. --lifespan off); compute once off the event loop
+        shape = await run_in_threadpool(_dataset_shape)
+    if shape is not None:
+        info.update({
+            "dataset_rows": shape[0],
+            "dataset_cols": shape[1],
+        })
     return info
 
 
-@app.post("/analyze_job", response_model=AnalyzeJobResponse)
-def analyze_job(payload: AnalyzeJobRequest, request: Request):
+@app.get("/cache_stats")
+async def cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the per-worker prediction cache."""
+    return prediction_cache_info()
+
+
+@app.post("/analyze_job", response_class=ORJSONResponse, response_model=None, responses={200: {"model": AnalyzeJobResponse}})
+async def analyze_job(payload: AnalyzeJobRequest, request: Request):
     start = time.time()
     try:
-        logger.info("analyze_job request: %s", {
-            "remote": request.client.host if request.client else None,
-            "title_len": len(payload.title or ""),
-            "description_len": len(payload.description or ""),
-            "followers": payload.company_followers,
-            "employees": payload.company_employees,
-            "engagement": payload.engagement_score,
-        })
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("analyze_job request: %s", {
+                "remote": request.client.host if request.client else None,
+                "title_len": len(payload.title or ""),
+                "description_len": len(payload.description or ""),
+                "followers": payload.company_followers,
+                "employees": payload.company_employees,
+                "engagement": payload.engagement_score,
+            })
 
-        result = predict_job(
-            title=payload.title,
-            description=payload.description,
-            requirements=payload.requirements,
-            company_profile=payload.company_profile,
-            followers=payload.company_followers,
-            employees=payload.company_employees,
-            engagement=payload.engagement_score,
-            company_strength=payload.company_strength,
-            missing_website_flag=payload.missing_website_flag,
-            suspicious_email_flag=payload.suspicious_email_flag,
-            short_profile_flag=payload.short_profile_flag,
-            suspicion_score=payload.suspicion_score,
-        )
+        result = await run_in_threadpool(predict_job, **_job_kwargs(payload))
 
-        logger.info("analyze_job response: %s", {
-            "prediction": result.get("prediction"),
-            "risk_score": result.get("risk_score"),
-            "prob_scam": result.get("probabilities", {}).get("scam"),
-            "keyword_hits": len(result.get("signals", {}).get("keywords_triggered", [])),
-            "latency_ms": int((time.time() - start) * 1000),
-        })
-        return AnalyzeJobResponse(**result)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("analyze_job response: %s", {
+                "prediction": result.get("prediction"),
+                "risk_score": result.get("risk_score"),
+                "prob_scam": result.get("probabilities", {}).get("scam"),
+                "keyword_hits": len(result.get("signals", {}).get("keywords_triggered", [])),
+                "latency_ms": int((time.time() - start) * 1000),
+            })
+        return _public_result(result)
     except ValidationError as ve:
         logger.warning("validation error: %s", ve)
         raise HTTPException(status_code=422, detail=ve.errors())
@@ -207,31 +368,42 @@ def analyze_job(payload: AnalyzeJobRequest, request: Request):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@app.post("/analyze_jobs", response_model=None, responses={200: {"model": AnalyzeJobsResponse}})
+async def analyze_jobs(payload: AnalyzeJobsRequest):
+    """Batch analysis: all postings are scored with a single model call."""
+    start = time.time()
+    try:
+        results = await run_in_threadpool(predict_jobs, [_job_kwargs(item) for item in payload.items])
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("analyze_jobs response: %s", {
+                "items": len(results),
+                "scam_count": sum(1 for r in results if r.get("prediction") == "scam"),
+                "latency_ms": int((time.time() - start) * 1000),
+            })
+        return {"items": [_public_result(r) for r in results]}
+    except ValidationError as ve:
+        logger.warning("validation error: %s", ve)
+        raise HTTPException(status_code=422, detail=ve.errors())
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("unhandled error")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 # Backwards-compatible alias expected by the new frontend
-@app.post("/analyze", response_model=AnalyzeJobResponse)
-def analyze(payload: AnalyzeJobRequest):
+@app.post("/analyze", response_model=None, responses={200: {"model": AnalyzeJobResponse}})
+async def analyze(payload: AnalyzeJobRequest):
     start = time.time()
     try:
-        result = predict_job(
-            title=payload.title,
-            description=payload.description,
-            requirements=payload.requirements,
-            company_profile=payload.company_profile,
-            followers=payload.company_followers,
-            employees=payload.company_employees,
-            engagement=payload.engagement_score,
-            company_strength=payload.company_strength,
-            missing_website_flag=payload.missing_website_flag,
-            suspicious_email_flag=payload.suspicious_email_flag,
-            short_profile_flag=payload.short_profile_flag,
-            suspicion_score=payload.suspicion_score,
-        )
-        logger.info("analyze (alias) response: %s", {
-            "prediction": result.get("prediction"),
-            "risk_score": result.get("risk_score"),
-            "latency_ms": int((time.time() - start) * 1000),
-        })
-        return AnalyzeJobResponse(**result)
+        result = await run_in_threadpool(predict_job, **_job_kwargs(payload))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("analyze (alias) response: %s", {
+                "prediction": result.get("prediction"),
+                "risk_score": result.get("risk_score"),
+                "latency_ms": int((time.time() - start) * 1000),
+            })
+        return _public_result(result)
     except ValidationError as ve:
         raise HTTPException(status_code=422, detail=ve.errors())
     except HTTPException:
@@ -241,4 +413,20 @@ def analyze(payload: AnalyzeJobRequest):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 # Local dev entrypoint: uvicorn fake_job_guru.api:app --reload
-
+# Production-style single process: python -m fake_job_guru.api (from fake_job_guruuu/)
+if __name__ == "__main__":
+    import sys
+    import uvicorn
+
+    # Pass the app object, not an import string: a second import of this module
+    # would get its own (undrained) log queue
+    uvicorn.run(
+        app,
+        host=os.getenv("HOST", "127.0.0.1"),
+        port=int(os.getenv("PORT", "8000")),
+        # uvloop has no Windows support; "auto" still picks the fastest available loop there
+        loop="uvloop" if sys.platform != "win32" else "auto",
+        http="httptools",
+        # Requests are already logged by the app
+        access_log=False,
+    )
@@ -1,8 +1,15 @@
 import pandas as pd
 import numpy as np
 import re
+import json
 from pathlib import Path
 
+try:
+    # Optional: JIT-compiled kernel for the strength buckets
+    from numba import njit
+except ImportError:
+    njit = None
+
 # Load the dataset
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -16,44 +23,59 @@ df["company_followers"] = np.random.randint(50, 50001, df.shape[0])
 df["company_employees"] = np.random.randint(1, 10001, df.shape[0])
 df["engagement_score"] = np.random.randint(0, 101, df.shape[0])
 
-def get_company_strength(followers, employees):
-    if followers < 500 or employees < 20:
-        return "weak"
-    elif 500 <= followers <= 5000:
-        return "medium"
-    else:
-        return "strong"
+# weak: followers < 500 or employees < 20; medium: 500-5000 followers; else strong
+STRENGTH_LABELS = ["weak", "medium", "strong"]
 
-df["company_strength"] = df.apply(
-    lambda row: get_company_strength(row["company_followers"], row["company_employees"]),
-    axis=1
-)
+if njit is not None:
+    @njit(cache=True)
+    def _strength_codes(followers, employees, out):
+        for i in range(followers.size):
+            if followers[i] < 500 or employees[i] < 20:
+                out[i] = 0
+            elif followers[i] <= 5000:
+                out[i] = 1
+            else:
+                out[i] = 2
+
+    codes = np.empty(df.shape[0], dtype=np.int8)
+    _strength_codes(
+        df["company_followers"].to_numpy(),
+        df["company_employees"].to_numpy(),
+        codes,
+    )
+    df["company_strength"] = pd.Categorical.from_codes(codes, categories=STRENGTH_LABELS)
+else:
+    df["company_strength"] = pd.Categorical(
+        np.select(
+            [
+                df["company_followers"].lt(500) | df["company_employees"].lt(20),
+                df["company_followers"].between(500, 5000),
+            ],
+            STRENGTH_LABELS[:2],
+            default=STRENGTH_LABELS[2],
+        ),
+        categories=STRENGTH_LABELS,
+    )
 
 # ============================
 # STEP 2: Scammy Indicator Flags
 # ============================
+profile = df["company_profile"].fillna("")
+
 # Missing website
-df["missing_website_flag"] = df["company_profile"].apply(
-    lambda x: 1 if (pd.isna(x) or "http" not in str(x).lower()) else 0
-)
+df["missing_website_flag"] = (
+    ~profile.str.contains("http", case=False, regex=False)
+).astype("int8")
 
 # Suspicious contact terms
-def suspicious_contact(text):
-    if pd.isna(text):
-        return 0
-    text = text.lower()
-    suspicious_terms = ["gmail", "yahoo", "telegram", "whatsapp"]
-    return 1 if any(term in text for term in suspicious_terms) else 0
-
-df["suspicious_email_flag"] = df.apply(
-    lambda row: suspicious_contact(str(row["description"])) or suspicious_contact(str(row["requirements"])),
-    axis=1
-)
+SUSPICIOUS_TERMS_PATTERN = "gmail|yahoo|telegram|whatsapp"
+df["suspicious_email_flag"] = (
+    df["description"].fillna("").str.contains(SUSPICIOUS_TERMS_PATTERN, case=False, regex=True) |
+    df["requirements"].fillna("").str.contains(SUSPICIOUS_TERMS_PATTERN, case=False, regex=True)
+).astype("int8")
 
 # Short company profile
-df["short_profile_flag"] = df["company_profile"].apply(
-    lambda x: 1 if (pd.isna(x) or len(str(x).split()) < 30) else 0
-)
+df["short_profile_flag"] = profile.str.split().str.len().lt(30).astype("int8")
 
 # ============================
 # STEP 3: Aggregate Suspicion Score
@@ -64,7 +86,11 @@ df["suspicion_score"] = (
     df["short_profile_flag"]
 )
 
-# Save enriched dataset
-df.to_csv(DATA_DIR / "enriched_dataset.csv", index=False)
+# Save enriched dataset (Parquet keeps company_strength as a categorical: int8 codes + 3 labels)
+df.to_parquet(DATA_DIR / "enriched_dataset.parquet", compression="zstd", index=False)
+
+# Shape metadata so the API can report it without loading the dataset
+with open(DATA_DIR / "enriched_dataset.meta.json", "w", encoding="utf-8") as f:
+    json.dump({"rows": int(df.shape[0]), "cols": int(df.shape[1])}, f)
 
-print("✅ Enrichment complete. Saved to data/enriched_dataset.csv")
+print("✅ Enrichment complete. Saved to data/enriched_dataset.parquet")
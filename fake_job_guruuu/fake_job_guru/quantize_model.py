@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+One-shot conversion of the trained scam model to float32 weights.
+
+Inference is a sparse TF-IDF row times the classifier coefficients, so storing
+`coef_`, `intercept_` and the vectorizer's `idf_` as float32 halves the memory
+those arrays take per worker. Predictions are unchanged beyond float32 rounding.
+
+Usage:
+    python quantize_model.py [--src PATH] [--dst PATH] [--compress N]
+
+By default reads the same model the API loads (`SCAM_MODEL_PATH` or the
+legacy file next to this script) and writes `<name>.f32.pkl` beside it.
+Pass `--compress 0` to keep the arrays memory-mappable.
+"""
+import argparse
+import os
+import sys
+import warnings
+from pathlib import Path
+
+import joblib
+import numpy as np
+
+try:
+    # Suppress scikit-learn minor version mismatch warnings from unpickling
+    from sklearn.exceptions import InconsistentVersionWarning  # type: ignore
+    warnings.filterwarnings("ignore", category=InconsistentVersionWarning)
+except Exception:
+    pass
+
+_THIS_DIR = Path(__file__).resolve().parent
+
+
+def _default_src() -> Path:
+    path = Path(os.getenv("SCAM_MODEL_PATH", str(_THIS_DIR.parent / "models" / "scam_detector.pkl")))
+    if not path.exists():
+        path = _THIS_DIR / "scam_detector.pkl"
+    return path
+
+
+def quantize(model):
+    """Cast the linear classifier and TF-IDF weights of `model` to float32 in place.
+
+    Returns the names of the converted attributes (empty if nothing matched).
+    """
+    steps = getattr(model, "steps", None)
+    # Final estimator of a Pipeline (whatever its step name), else the model itself
+    clf = model[-1] if steps else model
+    converted = []
+    for attr in ("coef_", "intercept_"):
+        if hasattr(clf, attr):
+            setattr(clf, attr, np.asarray(getattr(clf, attr), dtype=np.float32))
+            converted.append(attr)
+
+    for step in ([step for _, step in steps[:-1]] if steps else [model]):
+        if hasattr(step, "idf_"):
+            step.idf_ = np.asarray(step.idf_, dtype=np.float32)
+            converted.append("idf_")
+    return converted
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--src", type=Path, default=None, help="model to convert")
+    parser.add_argument("--dst", type=Path, default=None, help="output path")
+    parser.add_argument("--compress", type=int, default=3, help="joblib compression level (0 = none)")
+    args = parser.parse_args()
+
+    src = args.src or _default_src()
+    dst = args.dst or src.with_name(src.stem + ".f32.pkl")
+
+    model = joblib.load(str(src))
+    converted = quantize(model)
+    missing = [attr for attr in ("coef_", "idf_") if attr not in converted]
+    if missing:
+        sys.exit(f"❌ {src} has no {' / '.join(missing)} to convert (expected TF-IDF + linear classifier); nothing saved")
+    joblib.dump(model, str(dst), compress=args.compress)
+
+    print(f"✅ Saved float32 model to {dst} ({src.stat().st_size} -> {dst.stat().st_size} bytes)")
+    print(f"   Converted: {', '.join(converted)}")
+    print(f"   Use it with: SCAM_MODEL_PATH={dst}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,20 @@
 import re
 import math
 import os
+import hashlib
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 import joblib
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+
+try:
+    # Optional C-level Aho-Corasick automaton; falls back to `re` when missing
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None
 
 """
 Prediction utilities for scam detection with structured risk scoring.
@@ -24,6 +35,8 @@ Backwards compatibility:
 # ===============================
 # To override the model location, set environment variable `SCAM_MODEL_PATH`
 # to an absolute path or project-relative path to the `.pkl` file.
+# The file should live on a local filesystem: its NumPy arrays are memory-mapped
+# so that preforked workers (gunicorn --preload) share the same physical pages.
 _THIS_DIR = Path(__file__).resolve().parent
 # default: project_root/models/scam_detector.pkl
 _DEFAULT_MODEL = _THIS_DIR.parent / "models" / "scam_detector.pkl"
@@ -35,7 +48,70 @@ if not _MODEL_PATH.exists():
     if _LEGACY.exists():
         _MODEL_PATH = _LEGACY
 
-model = joblib.load(str(_MODEL_PATH))
+# mmap_mode only applies to uncompressed dumps; compressed ones load normally
+model = joblib.load(str(_MODEL_PATH), mmap_mode="r")
+
+# Index of the scam label (class 1) in predict_proba output; classes_ is typically [0, 1]
+_classes = list(getattr(model, "classes_", [0, 1]))
+_IDX_SCAM = _classes.index(1) if 1 in _classes else (1 if len(_classes) > 1 else 0)
+
+# Fast path for Pipeline(..., LogisticRegression) binary models: P(scam) is the
+# sigmoid of the decision function, so skip predict_proba's two-class
+# normalisation. Holds (feature transformer, weights, intercept, sign).
+_LINEAR = None
+_steps = getattr(model, "steps", None)
+if _steps and len(_steps) > 1 and 1 in _classes and len(_classes) == 2:
+    _clf = _steps[-1][1]
+    # Binary multinomial fits (sklearn < 1.8) also have one coef_ row but predict
+    # softmax([-d, d]) = sigmoid(2d), so only one-vs-rest/auto models qualify
+    if (
+        isinstance(_clf, LogisticRegression)
+        and getattr(_clf, "coef_", np.empty((0, 0))).shape[0] == 1
+        and getattr(_clf, "multi_class", "auto") in ("auto", "ovr", "warn", "deprecated")
+    ):
+        # decision_function scores classes_[1]; flip the sign if that is not the scam label
+        _LINEAR = (model[:-1], _clf.coef_[0], float(_clf.intercept_[0]), 1.0 if _IDX_SCAM == 1 else -1.0)
+
+
+def _scam_probabilities(texts: List[str]) -> np.ndarray:
+    """Return P(scam) for each text."""
+    if _LINEAR is not None:
+        features, weights, intercept, sign = _LINEAR
+        decision = features.transform(texts) @ weights + intercept
+        # Logistic sigmoid; exp overflow for very negative scores correctly yields 0.0
+        with np.errstate(over="ignore"):
+            return 1.0 / (1.0 + np.exp(-sign * decision))
+    return model.predict_proba(texts)[:, _IDX_SCAM]
+
+
+# Probe texts for the load-time checks below; mixed case exercises lowercasing
+_PROBE_TEXTS = ["Work From Home, Earn $500 fast cash via WhatsApp", "Senior Software Engineer, Python"]
+
+# Confirm the fast path reproduces predict_proba; otherwise fall back to it
+if _LINEAR is not None and not np.allclose(
+    _scam_probabilities(_PROBE_TEXTS), model.predict_proba(_PROBE_TEXTS)[:, _IDX_SCAM]
+):
+    _LINEAR = None
+
+
+# Whether the model's vectorizer lowercases its input (TfidfVectorizer default);
+# if so, it can be fed the already-lowercased text directly. sklearn ignores
+# `lowercase` with a custom preprocessor or callable analyzer, and the result is
+# double-checked on a mixed-case probe.
+_vectorizer = model[0] if getattr(model, "steps", None) else None
+_MODEL_LOWERCASES = (
+    bool(getattr(_vectorizer, "lowercase", False))
+    and getattr(_vectorizer, "preprocessor", None) is None
+    and isinstance(getattr(_vectorizer, "analyzer", None), str)
+)
+if _MODEL_LOWERCASES and not np.allclose(
+    _scam_probabilities(_PROBE_TEXTS), _scam_probabilities([t.lower() for t in _PROBE_TEXTS])
+):
+    _MODEL_LOWERCASES = False
+
+# Postings with no text vectorize to an all-zero row, so the model output is a
+# constant; compute it once and skip the vectorizer for such requests.
+_EMPTY_TEXT_PROB = float(_scam_probabilities([" "])[0])
 
 # Scammy keywords list
 SCAM_KEYWORDS = [
@@ -44,6 +120,55 @@ SCAM_KEYWORDS = [
     "fast cash", "limited slots", "easy income"
 ]
 
+# Contact channels commonly used to move applicants off-platform
+SUSPICIOUS_TERMS = ["gmail", "yahoo", "telegram", "whatsapp"]
+
+# Fallback: single compiled alternation so the text is scanned once per request;
+# named groups map each match back to its keyword.
+_SCAM_RE = re.compile(
+    "|".join(f"(?P<k{i}>{re.escape(kw)})" for i, kw in enumerate(SCAM_KEYWORDS)),
+    re.IGNORECASE,
+)
+_KW_BY_GROUP = {f"k{i}": kw for i, kw in enumerate(SCAM_KEYWORDS)}
+
+# One automaton for both term lists. Each pattern maps to
+# (scam keyword or None, is suspicious contact term); a pattern may be both.
+_AC = None
+if ahocorasick is not None:
+    _ac_terms: Dict[str, Tuple[Optional[str], bool]] = {}
+    for kw in SCAM_KEYWORDS:
+        _ac_terms[kw.lower()] = (kw, False)
+    for term in SUSPICIOUS_TERMS:
+        kw, _ = _ac_terms.get(term, (None, False))
+        _ac_terms[term] = (kw, True)
+    _AC = ahocorasick.Automaton()
+    for pattern, value in _ac_terms.items():
+        _AC.add_word(pattern, value)
+    _AC.make_automaton()
+
+
+def _scan_terms(lowered: str) -> Tuple[Set[str], bool]:
+    """Return (scam keywords found, whether any suspicious contact term occurs).
+
+    `lowered` must already be lowercased.
+    """
+    if _AC is not None:
+        keywords: Set[str] = set()
+        suspicious = False
+        for _, (kw, is_suspicious) in _AC.iter(lowered):
+            if kw is not None:
+                keywords.add(kw)
+            suspicious = suspicious or is_suspicious
+        return keywords, suspicious
+    keywords = {_KW_BY_GROUP[m.lastgroup] for m in _SCAM_RE.finditer(lowered)}
+    return keywords, any(term in lowered for term in SUSPICIOUS_TERMS)
+
+
+def _s(value: Any) -> str:
+    """Coerce to str without allocating when the value already is one."""
+    return value if type(value) is str else ("" if value is None else str(value))
+
+
 def _safe_int(value: Optional[Any], default: int = 0) -> int:
     try:
         if value is None:
@@ -62,20 +187,15 @@ def _compute_company_strength(followers: int, employees: int) -> str:
         return "strong"
 
 
-def _heuristic_flags(company_profile: Optional[str], description: Optional[str], requirements: Optional[str]) -> Dict[str, int]:
-    text_profile = "" if company_profile is None else str(company_profile)
-    text_desc = "" if description is None else str(description)
-    text_req = "" if requirements is None else str(requirements)
-
-    missing_website_flag = 1 if (len(text_profile) == 0 or "http" not in text_profile.lower()) else 0
+def _heuristic_flags_lower(prof_l: str, desc_l: str, req_l: str, prof_raw: str) -> Dict[str, int]:
+    """Heuristic flags from already-lowercased profile/description/requirements.
 
-    def suspicious_contact(text: str) -> int:
-        lowered = text.lower()
-        suspicious_terms = ["gmail", "yahoo", "telegram", "whatsapp"]
-        return 1 if any(term in lowered for term in suspicious_terms) else 0
-
-    suspicious_email_flag = 1 if (suspicious_contact(text_desc) or suspicious_contact(text_req)) else 0
-    short_profile_flag = 1 if (len(text_profile.strip()) == 0 or len(text_profile.split()) < 30) else 0
+    `prof_raw` is the original profile text, used only for the word count.
+    """
+    missing_website_flag = 1 if "http" not in prof_l else 0
+    # NUL separator keeps a term from matching across the field boundary
+    suspicious_email_flag = 1 if _scan_terms(f"{desc_l}\x00{req_l}")[1] else 0
+    short_profile_flag = 1 if len(prof_raw.split()) < 30 else 0
 
     suspicion_score = missing_website_flag + suspicious_email_flag + short_profile_flag
     return {
@@ -113,11 +233,64 @@ def _composite_risk(prob_scam: float, weak_company: bool, suspicion_score: int,
     }
 
 
-def predict_job(
-    title: Optional[str] = None,
-    description: Optional[str] = None,
-    requirements: Optional[str] = None,
-    company_profile: Optional[str] = None,
+# predict_job keyword arguments that carry enriched (non-text) features
+_ENRICHED_FIELDS = (
+    "followers", "employees", "engagement", "company_strength",
+    "missing_website_flag", "suspicious_email_flag", "short_profile_flag", "suspicion_score",
+)
+
+
+def _prepare_text(
+    title: Optional[str],
+    description: Optional[str],
+    requirements: Optional[str],
+    company_profile: Optional[str],
+) -> Tuple[str, Tuple[str, str, str, str], str]:
+    """Return (model text, lowercased (combined, description, requirements, profile), raw profile)."""
+    prof_s = _s(company_profile)
+
+    # Lowercase each field once; reused by model, keyword scan and heuristics
+    title_l = _s(title).lower()
+    desc_l = _s(description).lower()
+    req_l = _s(requirements).lower()
+    prof_l = prof_s.lower()
+    text_l = f"{title_l} {desc_l} {req_l} {prof_l}"
+
+    # Combine text for model; a lowercasing vectorizer gives identical features for text_l
+    if _MODEL_LOWERCASES:
+        text = text_l
+    else:
+        text = f"{_s(title)} {_s(description)} {_s(requirements)} {prof_s}"
+    return text, (text_l, desc_l, req_l, prof_l), prof_s
+
+
+def _text_signals(
+    lowered: Tuple[str, str, str, str],
+    prof_s: str,
+) -> Tuple[Tuple[str, ...], Tuple[int, int, int, int]]:
+    """Return (scam keywords found, heuristic flags) derived from the posting text.
+
+    Heuristic flags are (missing_website, suspicious_email, short_profile, suspicion_score).
+    """
+    text_l, desc_l, req_l, prof_l = lowered
+
+    # Keyword explainability (reported in SCAM_KEYWORDS order)
+    hits, _ = _scan_terms(text_l)
+    found_keywords = tuple(kw for kw in SCAM_KEYWORDS if kw in hits)
+
+    heur = _heuristic_flags_lower(prof_l, desc_l, req_l, prof_s)
+    return found_keywords, (
+        heur["missing_website_flag"],
+        heur["suspicious_email_flag"],
+        heur["short_profile_flag"],
+        heur["suspicion_score"],
+    )
+
+
+def _build_result(
+    prob_scam: float,
+    found_keywords: Tuple[str, ...],
+    heur: Tuple[int, int, int, int],
     followers: Optional[int] = None,
     employees: Optional[int] = None,
     engagement: Optional[int] = None,
@@ -127,34 +300,7 @@ def predict_job(
     short_profile_flag: Optional[int] = None,
     suspicion_score: Optional[int] = None,
 ) -> Dict[str, Any]:
-    """
-    Predict whether a job posting is scam or legit and return structured signals.
-
-    Any enriched feature parameters are optional. If omitted, lightweight heuristics
-    are applied to derive reasonable defaults.
-    """
-    # Combine text for model
-    text = " ".join([
-        str(title or ""),
-        str(description or ""),
-        str(requirements or ""),
-        str(company_profile or ""),
-    ])
-
-    # Model probability for class 1 (scam)
-    # Ensure we extract the probability for label 1 irrespective of ordering
-    proba = model.predict_proba([text])[0]
-    # model.classes_ is typically [0,1]; find index of class 1
-    try:
-        idx_scam = list(getattr(model, "classes_", [0, 1])).index(1)
-    except ValueError:
-        idx_scam = 1 if len(proba) > 1 else 0
-    prob_scam = float(proba[idx_scam])
-
-    # Keyword explainability
-    lowered = text.lower()
-    found_keywords = [kw for kw in SCAM_KEYWORDS if re.search(kw, lowered)]
-
+    """Combine the model probability with keyword/heuristic signals into the response dict."""
     # Company signals
     followers_i = _safe_int(followers, 0)
     employees_i = _safe_int(employees, 0)
@@ -165,12 +311,10 @@ def predict_job(
     weak_company = (followers_i < 500) or (employees_i < 10) or (engagement_i < 5)
 
     # Heuristic flags (prefer provided flags if supplied)
-    if missing_website_flag is None or suspicious_email_flag is None or short_profile_flag is None or suspicion_score is None:
-        heur = _heuristic_flags(company_profile, description, requirements)
-        missing_website_flag = heur["missing_website_flag"] if missing_website_flag is None else missing_website_flag
-        suspicious_email_flag = heur["suspicious_email_flag"] if suspicious_email_flag is None else suspicious_email_flag
-        short_profile_flag = heur["short_profile_flag"] if short_profile_flag is None else short_profile_flag
-        suspicion_score = heur["suspicion_score"] if suspicion_score is None else suspicion_score
+    missing_website_flag = heur[0] if missing_website_flag is None else missing_website_flag
+    suspicious_email_flag = heur[1] if suspicious_email_flag is None else suspicious_email_flag
+    short_profile_flag = heur[2] if short_profile_flag is None else short_profile_flag
+    suspicion_score = heur[3] if suspicion_score is None else suspicion_score
 
     # Composite risk with breakdown
     risk = _composite_risk(prob_scam, weak_company, int(suspicion_score), len(found_keywords))
@@ -186,7 +330,7 @@ def predict_job(
         },
         "risk_score": round(risk_score, 4),
         "signals": {
-            "keywords_triggered": found_keywords,
+            "keywords_triggered": list(found_keywords),
             "weak_company": weak_company,
             "company_strength": company_strength,
             "followers": followers_i,
@@ -206,6 +350,138 @@ def predict_job(
     return result
 
 
+_TextSignals = Tuple[float, Tuple[str, ...], Tuple[int, int, int, int]]
+
+
+def _predict_text(fields: Tuple[str, str, str, str]) -> _TextSignals:
+    """Text-derived part of a prediction for (title, description, requirements, company_profile)."""
+    text, lowered, prof_s = _prepare_text(*fields)
+
+    # Model probability for class 1 (scam); `text` is only separators when all fields are empty
+    if text.isspace():
+        prob_scam = _EMPTY_TEXT_PROB
+    else:
+        prob_scam = float(_scam_probabilities([text])[0])
+
+    found_keywords, heur = _text_signals(lowered, prof_s)
+    return prob_scam, found_keywords, heur
+
+
+# LRU memo of `_predict_text` so repeat submissions of the same posting skip
+# vectorization and scans. Keyed by a fixed-size digest of the fields, so memory
+# is bounded by entry count regardless of posting size.
+_PREDICT_CACHE_SIZE = 4096
+_predict_cache: "OrderedDict[bytes, _TextSignals]" = OrderedDict()
+_predict_cache_lock = threading.Lock()
+_predict_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _cache_key(fields: Tuple[str, str, str, str]) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    for field in fields:
+        data = field.encode("utf-8", "surrogatepass")
+        # Length prefix keeps field boundaries unambiguous
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.digest()
+
+
+def _predict_cached(fields: Tuple[str, str, str, str]) -> _TextSignals:
+    key = _cache_key(fields)
+    with _predict_cache_lock:
+        cached = _predict_cache.get(key)
+        if cached is not None:
+            _predict_cache.move_to_end(key)
+            _predict_cache_stats["hits"] += 1
+            return cached
+        _predict_cache_stats["misses"] += 1
+
+    value = _predict_text(fields)
+    with _predict_cache_lock:
+        _predict_cache[key] = value
+        _predict_cache.move_to_end(key)
+        if len(_predict_cache) > _PREDICT_CACHE_SIZE:
+            _predict_cache.popitem(last=False)
+    return value
+
+
+def prediction_cache_info() -> Dict[str, Any]:
+    """Hit/miss statistics of the `predict_job` memoization cache."""
+    with _predict_cache_lock:
+        return {
+            "hits": _predict_cache_stats["hits"],
+            "misses": _predict_cache_stats["misses"],
+            "maxsize": _PREDICT_CACHE_SIZE,
+            "currsize": len(_predict_cache),
+        }
+
+
+def predict_job(
+    title: Optional[str] = None,
+    description: Optional[str] = None,
+    requirements: Optional[str] = None,
+    company_profile: Optional[str] = None,
+    followers: Optional[int] = None,
+    employees: Optional[int] = None,
+    engagement: Optional[int] = None,
+    company_strength: Optional[str] = None,
+    missing_website_flag: Optional[int] = None,
+    suspicious_email_flag: Optional[int] = None,
+    short_profile_flag: Optional[int] = None,
+    suspicion_score: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Predict whether a job posting is scam or legit and return structured signals.
+
+    Any enriched feature parameters are optional. If omitted, lightweight heuristics
+    are applied to derive reasonable defaults.
+    """
+    prob_scam, found_keywords, heur = _predict_cached(
+        (_s(title), _s(description), _s(requirements), _s(company_profile))
+    )
+
+    return _build_result(
+        prob_scam,
+        found_keywords,
+        heur,
+        followers=followers,
+        employees=employees,
+        engagement=engagement,
+        company_strength=company_strength,
+        missing_website_flag=missing_website_flag,
+        suspicious_email_flag=suspicious_email_flag,
+        short_profile_flag=short_profile_flag,
+        suspicion_score=suspicion_score,
+    )
+
+
+def predict_jobs(jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Batch variant of `predict_job`.
+
+    Each item is a dict of `predict_job` keyword arguments. All texts are scored
+    with a single model call; results are returned in input order.
+    """
+    if not jobs:
+        return []
+    prepared = [
+        _prepare_text(job.get("title"), job.get("description"), job.get("requirements"), job.get("company_profile"))
+        for job in jobs
+    ]
+    probas = np.full(len(prepared), _EMPTY_TEXT_PROB)
+    scored = [i for i, (text, _, _) in enumerate(prepared) if not text.isspace()]
+    if scored:
+        probas[scored] = _scam_probabilities([prepared[i][0] for i in scored])
+    return [
+        _build_result(
+            float(prob_scam),
+            *_text_signals(lowered, prof_s),
+            **{name: job.get(name) for name in _ENRICHED_FIELDS},
+        )
+        for job, (_, lowered, prof_s), prob_scam in zip(jobs, prepared, probas)
+    ]
+
+
 # ===============================
 # Self-Test (runs if file is executed directly)
 # ===============================
@@ -234,3 +510,14 @@ if __name__ == "__main__":
     )
     print("\n✅ Legit Example Test:")
     print(legit_test)
+
+    # Batch path must agree with the single-item path
+    batch_jobs = [
+        dict(title="Data Entry Clerk", description="Earn $500/day working from home. Apply via Gmail.",
+             followers=120, employees=3, engagement=1),
+        dict(title="Software Engineer", company_profile="Reputed multinational http://example.com",
+             company_strength="strong", missing_website_flag=0, suspicion_score=1),
+        dict(),
+    ]
+    assert predict_jobs(batch_jobs) == [predict_job(**job) for job in batch_jobs], "predict_jobs != predict_job"
+    print("\n✅ Batch predictions match single predictions")
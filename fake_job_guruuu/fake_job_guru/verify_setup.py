@@ -64,6 +64,22 @@ def main():
         print(f"❌ Analysis error: {e}")
         return
     
+    # Test 4: Batch endpoint agrees with the single-item endpoint
+    try:
+        batch_response = requests.post(
+            'http://127.0.0.1:8000/analyze_jobs',
+            json={"items": [sample_data]},
+            timeout=10
+        )
+        if batch_response.status_code == 200 and batch_response.json()["items"][0] == result:
+            print("✅ Batch analysis endpoint working")
+        else:
+            print(f"❌ Batch analysis mismatch: {batch_response.status_code}")
+            return
+    except Exception as e:
+        print(f"❌ Batch analysis error: {e}")
+        return
+    
     print("\n" + "=" * 50)
     print("🎉 ALL TESTS PASSED!")
     print("🌐 Your web UI is ready at: http://127.0.0.1:8000")
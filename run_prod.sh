@@ -0,0 +1,11 @@
+#!/usr/bin/env bash
+# run_prod.sh — multi-worker server; the model is loaded once in the parent (--preload)
+# and shared with the forked workers via copy-on-write / memory-mapped arrays
+set -e
+ROOT="$(cd "$(dirname "$0")" && pwd)"
+export SCAM_MODEL_PATH="${SCAM_MODEL_PATH:-${ROOT}/models/scam_detector.pkl}"
+export PYTHONPATH="${ROOT}:${ROOT}/fake_job_guruuu${PYTHONPATH:+:$PYTHONPATH}"
+# UvicornWorker runs on uvloop + httptools when installed; no --access-logfile,
+# so the server does not duplicate the app's own request logging
+exec gunicorn asgi:app -k uvicorn.workers.UvicornWorker --preload \
+  --workers "${WEB_CONCURRENCY:-4}" --bind "${BIND:-0.0.0.0:8000}"